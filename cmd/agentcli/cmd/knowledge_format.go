@@ -41,6 +41,7 @@ func (tf *TableFormatter) FormatDocuments(docs []core.KnowledgeResult) string {
 	}
 
 	var output strings.Builder
+	output.Grow(200 + len(docs)*100) // header plus one ~100 byte row per document
 
 	// Header
 	output.WriteString(fmt.Sprintf("Found %d documents:\n\n", len(docs)))
@@ -96,8 +97,8 @@ func (tf *TableFormatter) FormatDocuments(docs []core.KnowledgeResult) string {
 			tagsStr = tagsStr[:17] + "..."
 		}
 
-		output.WriteString(fmt.Sprintf("%-40s %-15s %-12s %-20s %s\n",
-			title, docType, chunksInfo, updated, tagsStr))
+		fmt.Fprintf(&output, "%-40s %-15s %-12s %-20s %s\n",
+			title, docType, chunksInfo, updated, tagsStr)
 	}
 
 	return output.String()
@@ -109,6 +110,7 @@ func (tf *TableFormatter) FormatSearchResults(results []core.KnowledgeResult) st
 	}
 
 	var output strings.Builder
+	output.Grow(200 + len(results)*120) // header plus one ~120 byte row per result
 
 	// Header
 	output.WriteString(fmt.Sprintf("Found %d search results:\n\n", len(results)))
@@ -124,9 +126,12 @@ func (tf *TableFormatter) FormatSearchResults(results []core.KnowledgeResult) st
 			source = source[:34] + "..."
 		}
 
-		content := strings.ReplaceAll(result.Content, "\n", " ")
+		// Truncate before replacing newlines so long chunks are not copied in full
+		content := result.Content
 		if len(content) > 47 {
-			content = content[:44] + "..."
+			content = strings.ReplaceAll(content[:44], "\n", " ") + "..."
+		} else {
+			content = strings.ReplaceAll(content, "\n", " ")
 		}
 
 		tagsStr := strings.Join(result.Tags, ",")
@@ -134,8 +139,8 @@ func (tf *TableFormatter) FormatSearchResults(results []core.KnowledgeResult) st
 			tagsStr = tagsStr[:12] + "..."
 		}
 
-		output.WriteString(fmt.Sprintf("%-6s %-40s %-50s %s\n",
-			score, source, content, tagsStr))
+		fmt.Fprintf(&output, "%-6s %-40s %-50s %s\n",
+			score, source, content, tagsStr)
 	}
 
 	return output.String()
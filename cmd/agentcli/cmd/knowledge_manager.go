@@ -3,6 +3,7 @@ package cmd
 import (
 	"context"
 	"fmt"
+	"io/fs"
 	"os"
 	"path/filepath"
 	"strings"
@@ -283,14 +284,14 @@ func (km *KnowledgeManager) Upload(ctx context.Context, sources []string, option
 	skipped := 0
 
 	for i, filePath := range files {
-		fmt.Printf("[DEBUG] Starting file %d/%d: %s\n", i+1, len(files), filepath.Base(filePath))
+		fmt.Fprintf(os.Stderr, "[DEBUG] Starting file %d/%d: %s\n", i+1, len(files), filepath.Base(filePath))
 
 		if options.ShowProgress {
 			fmt.Printf("[%d/%d] Processing: %s\n", i+1, len(files), filepath.Base(filePath))
 		}
 
 		// Get processor for this file
-		fmt.Printf("[DEBUG] Getting processor for file: %s\n", filePath)
+		fmt.Fprintf(os.Stderr, "[DEBUG] Getting processor for file: %s\n", filePath)
 		processor, err := registry.GetProcessor(filePath)
 		if err != nil {
 			if options.ShowProgress {
@@ -299,7 +300,7 @@ func (km *KnowledgeManager) Upload(ctx context.Context, sources []string, option
 			skipped++
 			continue
 		}
-		fmt.Printf("[DEBUG] Got processor, creating processing options\n")
+		fmt.Fprintf(os.Stderr, "[DEBUG] Got processor, creating processing options\n")
 
 		// Create processing options
 		procOptions := ProcessingOptions{
@@ -313,7 +314,7 @@ func (km *KnowledgeManager) Upload(ctx context.Context, sources []string, option
 		}
 
 		// Process the document
-		fmt.Printf("[DEBUG] Processing document with processor\n")
+		fmt.Fprintf(os.Stderr, "[DEBUG] Processing document with processor\n")
 		doc, err := processor.Process(ctx, filePath, procOptions)
 		if err != nil {
 			if options.ShowProgress {
@@ -322,12 +323,12 @@ func (km *KnowledgeManager) Upload(ctx context.Context, sources []string, option
 			failed++
 			continue
 		}
-		fmt.Printf("[DEBUG] Document processed, checking chunking\n")
+		fmt.Fprintf(os.Stderr, "[DEBUG] Document processed, checking chunking\n")
 
 		// Handle chunking if enabled
 		var docsToIngest []*core.Document
 		if km.config.AgentMemory.ChunkSize > 0 && len(doc.Content) > km.config.AgentMemory.ChunkSize {
-			fmt.Printf("[DEBUG] Document needs chunking (size: %d, limit: %d)\n", len(doc.Content), km.config.AgentMemory.ChunkSize)
+			fmt.Fprintf(os.Stderr, "[DEBUG] Document needs chunking (size: %d, limit: %d)\n", len(doc.Content), km.config.AgentMemory.ChunkSize)
 			chunks, err := ChunkDocument(doc, km.config.AgentMemory.ChunkSize, km.config.AgentMemory.ChunkOverlap)
 			if err != nil {
 				if options.ShowProgress {
@@ -340,25 +341,25 @@ func (km *KnowledgeManager) Upload(ctx context.Context, sources []string, option
 			if options.ShowProgress {
 				fmt.Printf("  Created %d chunks\n", len(chunks))
 			}
-			fmt.Printf("[DEBUG] Created %d chunks\n", len(chunks))
+			fmt.Fprintf(os.Stderr, "[DEBUG] Created %d chunks\n", len(chunks))
 		} else {
-			fmt.Printf("[DEBUG] No chunking needed (size: %d, limit: %d)\n", len(doc.Content), km.config.AgentMemory.ChunkSize)
+			fmt.Fprintf(os.Stderr, "[DEBUG] No chunking needed (size: %d, limit: %d)\n", len(doc.Content), km.config.AgentMemory.ChunkSize)
 			docsToIngest = []*core.Document{doc}
 		}
 
 		// Ingest documents
-		fmt.Printf("[DEBUG] Starting ingestion of %d documents\n", len(docsToIngest))
+		fmt.Fprintf(os.Stderr, "[DEBUG] Starting ingestion of %d documents\n", len(docsToIngest))
 		for docIndex, docToIngest := range docsToIngest {
-			fmt.Printf("[DEBUG] Ingesting document %d/%d\n", docIndex+1, len(docsToIngest))
+			fmt.Fprintf(os.Stderr, "[DEBUG] Ingesting document %d/%d\n", docIndex+1, len(docsToIngest))
 			if err := km.memory.IngestDocument(ctx, *docToIngest); err != nil {
-				fmt.Printf("[DEBUG] Ingestion failed: %v\n", err)
+				fmt.Fprintf(os.Stderr, "[DEBUG] Ingestion failed: %v\n", err)
 				if options.ShowProgress {
 					fmt.Printf("  Failed to ingest: %v\n", err)
 				}
 				failed++
 				break
 			}
-			fmt.Printf("[DEBUG] Document %d ingested successfully\n", docIndex+1)
+			fmt.Fprintf(os.Stderr, "[DEBUG] Document %d ingested successfully\n", docIndex+1)
 		}
 
 		processed++
@@ -415,13 +416,14 @@ func (km *KnowledgeManager) collectFromDirectory(dirPath string, recursive bool,
 	var files []string
 
 	if recursive {
-		// Walk directory tree
-		err := filepath.Walk(dirPath, func(path string, info os.FileInfo, err error) error {
+		// Walk directory tree. WalkDir takes the entry type from the directory
+		// read itself instead of issuing an lstat for every visited entry.
+		err := filepath.WalkDir(dirPath, func(path string, d fs.DirEntry, err error) error {
 			if err != nil {
 				return err
 			}
 
-			if !info.IsDir() && km.isSupportedFile(path, supportedExts) {
+			if !d.IsDir() && km.isSupportedFile(path, supportedExts) {
 				files = append(files, path)
 			}
 
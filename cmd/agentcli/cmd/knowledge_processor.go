@@ -8,6 +8,7 @@ import (
 	"path/filepath"
 	"strings"
 	"time"
+	"unicode"
 
 	"github.com/agenticgokit/agenticgokit/core"
 )
@@ -189,8 +190,8 @@ func (mp *MarkdownProcessor) Process(ctx context.Context, filePath string, optio
 			metadata["headers"] = headers
 		}
 
-		metadata["word_count"] = len(strings.Fields(contentStr))
-		metadata["line_count"] = len(strings.Split(contentStr, "\n"))
+		metadata["word_count"] = countWords(contentStr)
+		metadata["line_count"] = strings.Count(contentStr, "\n") + 1
 	}
 
 	// Create document
@@ -233,9 +234,11 @@ func (mp *MarkdownProcessor) ExtractMetadata(filePath string) (map[string]any, e
 
 // extractMarkdownTitle attempts to extract the title from markdown content
 func (mp *MarkdownProcessor) extractMarkdownTitle(content string) string {
-	lines := strings.Split(content, "\n")
-
-	for _, line := range lines {
+	// Walk the leading lines in place; the title is near the top, so there is
+	// no need to split the whole document into a slice of lines.
+	for rest := content; ; {
+		line, tail, more := strings.Cut(rest, "\n")
+		rest = tail
 		line = strings.TrimSpace(line)
 		// Look for H1 headers
 		if strings.HasPrefix(line, "# ") {
@@ -245,6 +248,9 @@ func (mp *MarkdownProcessor) extractMarkdownTitle(content string) string {
 		if line != "" && !strings.HasPrefix(line, "#") {
 			break
 		}
+		if !more {
+			break
+		}
 	}
 
 	return ""
@@ -294,6 +300,21 @@ func generateDocumentID(filePath string, content []byte) string {
 	return fmt.Sprintf("%x", hasher.Sum(nil))
 }
 
+// countWords returns len(strings.Fields(s)) without allocating the fields
+func countWords(s string) int {
+	count := 0
+	inWord := false
+	for _, r := range s {
+		if unicode.IsSpace(r) {
+			inWord = false
+		} else if !inWord {
+			inWord = true
+			count++
+		}
+	}
+	return count
+}
+
 // extractTitleFromPath creates a title from the file path
 func extractTitleFromPath(filePath string) string {
 	base := filepath.Base(filePath)
@@ -325,7 +346,7 @@ func CreateDocumentFromFile(filePath string, options ProcessingOptions) (*core.D
 
 // ChunkDocument splits a document into smaller chunks for better embedding
 func ChunkDocument(doc *core.Document, chunkSize, chunkOverlap int) ([]*core.Document, error) {
-	fmt.Printf("[DEBUG CHUNK] Starting chunking: doc length=%d, chunkSize=%d, chunkOverlap=%d\n", len(doc.Content), chunkSize, chunkOverlap)
+	fmt.Fprintf(os.Stderr, "[DEBUG CHUNK] Starting chunking: doc length=%d, chunkSize=%d, chunkOverlap=%d\n", len(doc.Content), chunkSize, chunkOverlap)
 
 	if chunkSize <= 0 {
 		return []*core.Document{doc}, nil
@@ -341,7 +362,7 @@ func ChunkDocument(doc *core.Document, chunkSize, chunkOverlap int) ([]*core.Doc
 	chunkIndex := 1
 
 	for start < len(content) {
-		fmt.Printf("[DEBUG CHUNK] Loop %d: start=%d, content remaining=%d\n", chunkIndex, start, len(content)-start)
+		fmt.Fprintf(os.Stderr, "[DEBUG CHUNK] Loop %d: start=%d, content remaining=%d\n", chunkIndex, start, len(content)-start)
 
 		end := start + chunkSize
 		if end > len(content) {
@@ -360,7 +381,7 @@ func ChunkDocument(doc *core.Document, chunkSize, chunkOverlap int) ([]*core.Doc
 		}
 
 		chunkContent := content[start:end]
-		fmt.Printf("[DEBUG CHUNK] Chunk %d: start=%d, end=%d, length=%d, content='%s'\n", chunkIndex, start, end, len(chunkContent), chunkContent[:min(len(chunkContent), 50)])
+		fmt.Fprintf(os.Stderr, "[DEBUG CHUNK] Chunk %d: start=%d, end=%d, length=%d, content='%s'\n", chunkIndex, start, end, len(chunkContent), chunkContent[:min(len(chunkContent), 50)])
 
 		// Create chunk document
 		chunk := &core.Document{
@@ -387,15 +408,15 @@ func ChunkDocument(doc *core.Document, chunkSize, chunkOverlap int) ([]*core.Doc
 
 		// Move start position with overlap
 		newStart := end - chunkOverlap
-		fmt.Printf("[DEBUG CHUNK] Calculating newStart: end=%d - chunkOverlap=%d = %d\n", end, chunkOverlap, newStart)
+		fmt.Fprintf(os.Stderr, "[DEBUG CHUNK] Calculating newStart: end=%d - chunkOverlap=%d = %d\n", end, chunkOverlap, newStart)
 
 		if newStart <= start {
 			// Ensure we always advance to prevent infinite loops
 			// But advance by a reasonable amount, not just 1 character
 			newStart = start + (chunkSize / 2) // Advance by half chunk size
-			fmt.Printf("[DEBUG CHUNK] newStart <= start, advancing by chunkSize/2: newStart=%d\n", newStart)
+			fmt.Fprintf(os.Stderr, "[DEBUG CHUNK] newStart <= start, advancing by chunkSize/2: newStart=%d\n", newStart)
 			if newStart >= len(content) {
-				fmt.Printf("[DEBUG CHUNK] newStart >= content length, breaking\n")
+				fmt.Fprintf(os.Stderr, "[DEBUG CHUNK] newStart >= content length, breaking\n")
 				break // We've reached the end
 			}
 		}
@@ -403,7 +424,7 @@ func ChunkDocument(doc *core.Document, chunkSize, chunkOverlap int) ([]*core.Doc
 		chunkIndex++
 
 		if chunkIndex > 110 {
-			fmt.Printf("[DEBUG CHUNK] Safety break at chunk %d to prevent runaway\n", chunkIndex)
+			fmt.Fprintf(os.Stderr, "[DEBUG CHUNK] Safety break at chunk %d to prevent runaway\n", chunkIndex)
 			break
 		}
 	}
@@ -414,7 +435,7 @@ func ChunkDocument(doc *core.Document, chunkSize, chunkOverlap int) ([]*core.Doc
 		chunk.Metadata["chunk_total"] = len(chunks)
 	}
 
-	fmt.Printf("[DEBUG CHUNK] Completed chunking: created %d chunks\n", len(chunks))
+	fmt.Fprintf(os.Stderr, "[DEBUG CHUNK] Completed chunking: created %d chunks\n", len(chunks))
 	return chunks, nil
 }
 
@@ -2,8 +2,10 @@ package cmd
 
 import (
 	"context"
+	"fmt"
 	"os"
 	"path/filepath"
+	"strings"
 	"testing"
 	"time"
 
@@ -312,6 +314,76 @@ func TestHelperFunctions(t *testing.T) {
 	})
 }
 
+func TestMarkdownProcessorHelpers(t *testing.T) {
+	t.Run("countWords", func(t *testing.T) {
+		tests := []string{
+			"",
+			"   ",
+			"one",
+			"one two  three",
+			"\tleading and trailing\n",
+			"no\u00a0break\u00a0space",
+			"next\u0085line",
+			"ideographic\u3000space",
+			"invalid \xff\xfe utf8",
+			"\xffword",
+			"mixed\r\nline\vendings\f",
+		}
+
+		for _, input := range tests {
+			assert.Equal(t, len(strings.Fields(input)), countWords(input), "Input: %q", input)
+		}
+	})
+
+	t.Run("extractMarkdownTitle", func(t *testing.T) {
+		mp := &MarkdownProcessor{}
+		tests := []struct {
+			content  string
+			expected string
+		}{
+			{"", ""},
+			{"# Title", "Title"},
+			{"# Title\n", "Title"},
+			{"\n\n# Title\nBody", "Title"},
+			{"  \n  # Indented Title  \nBody", "Indented Title"},
+			{"## Section\n# Title\nBody", "Title"},
+			{"#NoSpace\n# Title", "Title"},
+			{"Intro text\n# Title", ""},
+			{"## Only Section", ""},
+			{"\n\n", ""},
+		}
+
+		for _, test := range tests {
+			assert.Equal(t, test.expected, mp.extractMarkdownTitle(test.content), "Content: %q", test.content)
+		}
+	})
+
+	t.Run("line_count", func(t *testing.T) {
+		tempDir := t.TempDir()
+		mp := &MarkdownProcessor{}
+		tests := []struct {
+			content  string
+			expected int
+		}{
+			{"", 1},
+			{"one line", 1},
+			{"one line\n", 2},
+			{"# Title\n\nBody\n", 4},
+			{"\n", 2},
+		}
+
+		for i, test := range tests {
+			path := filepath.Join(tempDir, fmt.Sprintf("doc%d.md", i))
+			require.NoError(t, os.WriteFile(path, []byte(test.content), 0644))
+
+			doc, err := mp.Process(context.Background(), path, ProcessingOptions{IncludeMetadata: true})
+			require.NoError(t, err)
+			assert.Equal(t, test.expected, doc.Metadata["line_count"], "Content: %q", test.content)
+			assert.Equal(t, len(strings.Split(test.content, "\n")), doc.Metadata["line_count"], "Content: %q", test.content)
+		}
+	})
+}
+
 // Integration Tests
 
 func TestKnowledgeManagerIntegration(t *testing.T) {
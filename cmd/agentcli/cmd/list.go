@@ -35,27 +35,27 @@ func listSessions() {
 		os.Exit(1)
 	}
 
-	var sessionIDs []string
 	const traceSuffix = ".trace.json"
 
+	// Write matching sessions straight into the tabwriter instead of
+	// collecting them into an intermediate slice first.
+	var w *tabwriter.Writer
 	for _, file := range files {
-		if !file.IsDir() && strings.HasSuffix(file.Name(), traceSuffix) {
-			sessionID := strings.TrimSuffix(file.Name(), traceSuffix)
-			sessionIDs = append(sessionIDs, sessionID)
+		if file.IsDir() || !strings.HasSuffix(file.Name(), traceSuffix) {
+			continue
 		}
+		if w == nil {
+			fmt.Println("Available Sessions (from trace files):")
+			w = tabwriter.NewWriter(os.Stdout, 0, 0, 1, ' ', 0)
+			fmt.Fprintln(w, "SESSION ID")
+			fmt.Fprintln(w, "----------")
+		}
+		fmt.Fprintln(w, strings.TrimSuffix(file.Name(), traceSuffix))
 	}
 
-	if len(sessionIDs) == 0 {
+	if w == nil {
 		fmt.Println("No session trace files (*.trace.json) found in the current directory.")
 		return
 	}
-
-	fmt.Println("Available Sessions (from trace files):")
-	w := tabwriter.NewWriter(os.Stdout, 0, 0, 1, ' ', 0)
-	fmt.Fprintln(w, "SESSION ID")
-	fmt.Fprintln(w, "----------")
-	for _, id := range sessionIDs {
-		fmt.Fprintln(w, id)
-	}
 	w.Flush()
 }
@@ -21,6 +21,7 @@ import (
 	"encoding/hex"
 	"encoding/json"
 	"fmt"
+	"io"
 	"sort"
 	"strings"
 	"sync"
@@ -1126,7 +1127,11 @@ func generateArgHash(args map[string]string) string {
 
 	h := sha256.New()
 	for _, k := range keys {
-		h.Write([]byte(k + "=" + args[k] + "|"))
+		// Write the pieces directly; same bytes as hashing k + "=" + v + "|"
+		io.WriteString(h, k)
+		io.WriteString(h, "=")
+		io.WriteString(h, args[k])
+		io.WriteString(h, "|")
 	}
 	return hex.EncodeToString(h.Sum(nil))[:16] // Use first 16 chars for brevity
 }
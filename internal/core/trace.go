@@ -1,6 +1,7 @@
 package agentflow
 
 import (
+	"bytes"
 	"context"
 	"encoding/json"
 	"fmt"
@@ -398,6 +399,7 @@ func (l *FileTraceLogger) Log(entry TraceEntry) error {
 
 	file, ok := l.files[entry.SessionID]
 	var err error
+	separator := ",\n"
 	if !ok {
 		filename := filepath.Join(l.logDir, fmt.Sprintf("%s.trace.json", entry.SessionID))
 		// Open in append mode, create if not exists
@@ -405,30 +407,36 @@ func (l *FileTraceLogger) Log(entry TraceEntry) error {
 		if err != nil {
 			return fmt.Errorf("failed to open trace file '%s': %w", filename, err)
 		}
-		l.files[SessionIDKey] = file
-		// Write '[' if the file is new/empty to start the JSON array
+		// Start the JSON array if the file is new/empty
 		if stat, _ := file.Stat(); stat.Size() == 0 {
-			if _, err := file.WriteString("[\n"); err != nil {
-				return fmt.Errorf("failed to write initial '[' to trace file '%s': %w", filename, err)
-			}
-		} else {
-			// If file not empty, add comma before new entry
-			if _, err := file.WriteString(",\n"); err != nil {
-				return fmt.Errorf("failed to write separator to trace file '%s': %w", filename, err)
-			}
-		}
-	} else {
-		// If file exists, add comma before new entry
-		if _, err := file.WriteString(",\n"); err != nil {
-			return fmt.Errorf("failed to write separator to trace file '%s': %w", file.Name(), err)
+			separator = "[\n"
 		}
 	}
 
-	encoder := json.NewEncoder(file)
+	// Frame the separator and the encoded entry into one buffer so each entry
+	// costs a single write syscall instead of two.
+	var buf bytes.Buffer
+	buf.WriteString(separator)
+	encoder := json.NewEncoder(&buf)
 	encoder.SetIndent("", "  ") // Pretty print
 	if err := encoder.Encode(entry); err != nil {
+		if !ok {
+			file.Close()
+		}
 		return fmt.Errorf("failed to encode trace entry to file '%s': %w", file.Name(), err)
 	}
+	if _, err := file.Write(buf.Bytes()); err != nil {
+		if !ok {
+			file.Close()
+		}
+		return fmt.Errorf("failed to write trace entry to file '%s': %w", file.Name(), err)
+	}
+
+	// Only cache a newly opened handle once its first entry is on disk, so a
+	// failed first write leaves the next Log to open the array again.
+	if !ok {
+		l.files[entry.SessionID] = file
+	}
 
 	return nil
 }
@@ -1,7 +1,10 @@
 package agentflow
 
 import (
+	"encoding/json"
 	"fmt"
+	"os"
+	"path/filepath"
 	"sync"
 	"testing"
 	"time"
@@ -196,3 +199,53 @@ func TestInMemoryTraceLogger_Concurrency(t *testing.T) {
 		}
 	}
 }
+
+func TestFileTraceLogger_ReusesHandlesAndWritesValidJSON(t *testing.T) {
+	logDir := t.TempDir()
+	logger, err := NewFileTraceLogger(logDir)
+	require.NoError(t, err)
+
+	sessions := []string{"session-file-1", "session-file-2"}
+	const entriesPerSession = 3
+
+	handles := make(map[string]*os.File)
+	for i := 0; i < entriesPerSession; i++ {
+		for _, sessionID := range sessions {
+			err := logger.Log(TraceEntry{
+				SessionID: sessionID,
+				Timestamp: time.Now(),
+				Type:      "agent_start",
+				Hook:      HookBeforeAgentRun,
+				EventID:   fmt.Sprintf("%s-event-%d", sessionID, i),
+				AgentID:   "compute",
+			})
+			require.NoError(t, err)
+
+			// Each session's file is opened once and reused for later entries
+			file := logger.files[sessionID]
+			require.NotNil(t, file)
+			if first, ok := handles[sessionID]; ok {
+				assert.Same(t, first, file, "trace file for %s should not be reopened", sessionID)
+			} else {
+				handles[sessionID] = file
+			}
+		}
+	}
+	assert.Len(t, logger.files, len(sessions))
+
+	require.NoError(t, logger.Close())
+	assert.Empty(t, logger.files)
+
+	for _, sessionID := range sessions {
+		data, err := os.ReadFile(filepath.Join(logDir, sessionID+".trace.json"))
+		require.NoError(t, err)
+
+		var entries []map[string]any
+		require.NoError(t, json.Unmarshal(data, &entries), "trace file for %s should be a JSON array", sessionID)
+		require.Len(t, entries, entriesPerSession)
+		for i, entry := range entries {
+			assert.Equal(t, sessionID, entry["session_id"])
+			assert.Equal(t, fmt.Sprintf("%s-event-%d", sessionID, i), entry["event_id"])
+		}
+	}
+}
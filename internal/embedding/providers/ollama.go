@@ -83,21 +83,18 @@ func (s *OllamaEmbeddingService) GenerateEmbedding(ctx context.Context, text str
 	}
 	defer resp.Body.Close()
 
-	// Read response
-	responseBody, err := io.ReadAll(resp.Body)
-	if err != nil {
-		return nil, fmt.Errorf("failed to read response: %w", err)
-	}
-
 	if resp.StatusCode != http.StatusOK {
+		responseBody, _ := io.ReadAll(resp.Body)
 		return nil, fmt.Errorf("API request failed with status %d: %s", resp.StatusCode, string(responseBody))
 	}
 
-	// Parse response
+	// Decode the response straight from the body rather than buffering it first
 	var response ollamaEmbeddingResponse
-	if err := json.Unmarshal(responseBody, &response); err != nil {
+	if err := json.NewDecoder(resp.Body).Decode(&response); err != nil {
 		return nil, fmt.Errorf("failed to parse response: %w", err)
 	}
+	// Drain anything after the JSON value so the connection can be reused
+	io.Copy(io.Discard, resp.Body)
 
 	if len(response.Embedding) == 0 {
 		return nil, fmt.Errorf("no embedding returned from Ollama")
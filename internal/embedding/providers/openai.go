@@ -111,22 +111,19 @@ func (s *OpenAIEmbeddingService) GenerateEmbeddings(ctx context.Context, texts [
 	}
 	defer resp.Body.Close()
 
-	// Read response
-	responseBody, err := io.ReadAll(resp.Body)
-	if err != nil {
-		return nil, fmt.Errorf("failed to read response: %w", err)
-	}
-
 	// Check for errors
 	if resp.StatusCode != http.StatusOK {
+		responseBody, _ := io.ReadAll(resp.Body)
 		return nil, fmt.Errorf("API error %d: %s", resp.StatusCode, string(responseBody))
 	}
 
-	// Parse response
+	// Decode the response straight from the body rather than buffering it first
 	var response openAIEmbeddingResponse
-	if err := json.Unmarshal(responseBody, &response); err != nil {
+	if err := json.NewDecoder(resp.Body).Decode(&response); err != nil {
 		return nil, fmt.Errorf("failed to unmarshal response: %w", err)
 	}
+	// Drain anything after the JSON value so the connection can be reused
+	io.Copy(io.Discard, resp.Body)
 
 	// Extract embeddings
 	embeddings := make([][]float32, len(response.Data))
@@ -87,6 +87,7 @@ func (o *OllamaAdapter) Call(ctx context.Context, prompt Prompt) (Response, erro
 	// Add images if present
 	if len(prompt.Images) > 0 {
 		images := []string{}
+		imageClient := &http.Client{Timeout: 30 * time.Second}
 		for _, img := range prompt.Images {
 			// Ollama expects base64 strings
 			if img.Base64 != "" {
@@ -98,25 +99,8 @@ func (o *OllamaAdapter) Call(ctx context.Context, prompt Prompt) (Response, erro
 				images = append(images, base64Data)
 			} else if img.URL != "" {
 				// Fetch URL and convert to base64
-				req, err := http.NewRequestWithContext(ctx, "GET", img.URL, nil)
-				if err != nil {
-					continue
-				}
-				req.Header.Set("User-Agent", "AgenticGoKit/1.0")
-
-				client := &http.Client{Timeout: 30 * time.Second}
-				resp, err := client.Do(req)
-				if err != nil {
-					continue
-				}
-				defer resp.Body.Close()
-
-				if resp.StatusCode == http.StatusOK {
-					data, err := io.ReadAll(resp.Body)
-					if err == nil {
-						base64Data := base64.StdEncoding.EncodeToString(data)
-						images = append(images, base64Data)
-					}
+				if base64Data, ok := fetchImageBase64(ctx, imageClient, img.URL); ok {
+					images = append(images, base64Data)
 				}
 			}
 		}
@@ -199,6 +183,7 @@ func (o *OllamaAdapter) Stream(ctx context.Context, prompt Prompt) (<-chan Token
 	// Add images if present
 	if len(prompt.Images) > 0 {
 		images := []string{}
+		imageClient := &http.Client{Timeout: 30 * time.Second}
 		for _, img := range prompt.Images {
 			if img.Base64 != "" {
 				base64Data := img.Base64
@@ -208,25 +193,8 @@ func (o *OllamaAdapter) Stream(ctx context.Context, prompt Prompt) (<-chan Token
 				images = append(images, base64Data)
 			} else if img.URL != "" {
 				// Fetch URL and convert to base64
-				req, err := http.NewRequestWithContext(ctx, "GET", img.URL, nil)
-				if err != nil {
-					continue
-				}
-				req.Header.Set("User-Agent", "AgenticGoKit/1.0")
-
-				client := &http.Client{Timeout: 30 * time.Second}
-				resp, err := client.Do(req)
-				if err != nil {
-					continue
-				}
-				defer resp.Body.Close()
-
-				if resp.StatusCode == http.StatusOK {
-					data, err := io.ReadAll(resp.Body)
-					if err == nil {
-						base64Data := base64.StdEncoding.EncodeToString(data)
-						images = append(images, base64Data)
-					}
+				if base64Data, ok := fetchImageBase64(ctx, imageClient, img.URL); ok {
+					images = append(images, base64Data)
 				}
 			}
 		}
@@ -337,52 +305,95 @@ func (o *OllamaAdapter) Embeddings(ctx context.Context, texts []string) ([][]flo
 
 	embeddings := make([][]float64, len(texts))
 
-	// Process each text individually as Ollama embeddings API typically handles one at a time
+	// Process each text individually as Ollama embeddings API typically handles one at a time.
+	// embedText drains and closes each response body before returning, so the
+	// connection goes back to the keep-alive pool before the next text is sent.
+	client := &http.Client{
+		Timeout: 30 * time.Second,
+	}
 	for i, text := range texts {
-		requestBody := map[string]interface{}{
-			"model":  embeddingModel,
-			"prompt": text,
-		}
-
-		payload, err := json.Marshal(requestBody)
+		embedding, err := o.embedText(ctx, client, embeddingModel, i, text)
 		if err != nil {
-			return nil, fmt.Errorf("failed to marshal request body for text %d: %w", i, err)
+			return nil, err
 		}
+		embeddings[i] = embedding
+	}
 
-		// Make the HTTP request with timeout
-		client := &http.Client{
-			Timeout: 30 * time.Second,
-		}
-		req, err := http.NewRequestWithContext(ctx, "POST", fmt.Sprintf("%s/api/embeddings", o.baseURL), bytes.NewBuffer(payload))
-		if err != nil {
-			return nil, fmt.Errorf("failed to create HTTP request for text %d: %w", i, err)
-		}
-		req.Header.Set("Content-Type", "application/json")
+	return embeddings, nil
+}
 
-		resp, err := client.Do(req)
-		if err != nil {
-			return nil, fmt.Errorf("HTTP request failed for text %d: %w", i, err)
-		}
-		defer resp.Body.Close()
+// embedText requests the embedding for a single text. The response body is
+// drained and closed before returning so its connection goes back to the
+// client's pool before the next text in the batch is sent.
+func (o *OllamaAdapter) embedText(ctx context.Context, client *http.Client, embeddingModel string, i int, text string) ([]float64, error) {
+	requestBody := map[string]interface{}{
+		"model":  embeddingModel,
+		"prompt": text,
+	}
 
-		if resp.StatusCode != http.StatusOK {
-			body, _ := io.ReadAll(resp.Body)
-			return nil, fmt.Errorf("Ollama embeddings API error for text %d: %s", i, string(body))
-		}
+	payload, err := json.Marshal(requestBody)
+	if err != nil {
+		return nil, fmt.Errorf("failed to marshal request body for text %d: %w", i, err)
+	}
 
-		var apiResp struct {
-			Embedding []float64 `json:"embedding"`
-		}
-		if err := json.NewDecoder(resp.Body).Decode(&apiResp); err != nil {
-			return nil, fmt.Errorf("failed to decode embeddings response for text %d: %w", i, err)
-		}
+	req, err := http.NewRequestWithContext(ctx, "POST", fmt.Sprintf("%s/api/embeddings", o.baseURL), bytes.NewBuffer(payload))
+	if err != nil {
+		return nil, fmt.Errorf("failed to create HTTP request for text %d: %w", i, err)
+	}
+	req.Header.Set("Content-Type", "application/json")
 
-		if len(apiResp.Embedding) == 0 {
-			return nil, fmt.Errorf("empty embedding returned for text %d", i)
-		}
+	resp, err := client.Do(req)
+	if err != nil {
+		return nil, fmt.Errorf("HTTP request failed for text %d: %w", i, err)
+	}
+	defer resp.Body.Close()
 
-		embeddings[i] = apiResp.Embedding
+	if resp.StatusCode != http.StatusOK {
+		body, _ := io.ReadAll(resp.Body)
+		return nil, fmt.Errorf("Ollama embeddings API error for text %d: %s", i, string(body))
 	}
 
-	return embeddings, nil
+	var apiResp struct {
+		Embedding []float64 `json:"embedding"`
+	}
+	if err := json.NewDecoder(resp.Body).Decode(&apiResp); err != nil {
+		return nil, fmt.Errorf("failed to decode embeddings response for text %d: %w", i, err)
+	}
+	// Drain anything after the JSON value so the connection can be reused
+	io.Copy(io.Discard, resp.Body)
+
+	if len(apiResp.Embedding) == 0 {
+		return nil, fmt.Errorf("empty embedding returned for text %d", i)
+	}
+
+	return apiResp.Embedding, nil
+}
+
+// fetchImageBase64 downloads an image URL and returns it base64 encoded.
+// The response body is drained and closed before returning rather than at the
+// end of the caller, so fetching several images does not hold several
+// connections open.
+func fetchImageBase64(ctx context.Context, client *http.Client, url string) (string, bool) {
+	req, err := http.NewRequestWithContext(ctx, "GET", url, nil)
+	if err != nil {
+		return "", false
+	}
+	req.Header.Set("User-Agent", "AgenticGoKit/1.0")
+
+	resp, err := client.Do(req)
+	if err != nil {
+		return "", false
+	}
+	defer resp.Body.Close()
+
+	if resp.StatusCode != http.StatusOK {
+		// Drain the error body so the connection can be reused
+		io.Copy(io.Discard, resp.Body)
+		return "", false
+	}
+	data, err := io.ReadAll(resp.Body)
+	if err != nil {
+		return "", false
+	}
+	return base64.StdEncoding.EncodeToString(data), true
 }
@@ -2,6 +2,7 @@
 package mcp
 
 import (
+	"container/list"
 	"context"
 	"fmt"
 	"sync"
@@ -14,7 +15,7 @@ import (
 type MemoryCache struct {
 	mu          sync.RWMutex
 	data        map[string]*cacheEntry
-	accessOrder []string // LRU tracking
+	accessOrder *list.List // LRU tracking: front is least, back is most recently used
 	config      core.MCPCacheConfig
 	stats       cacheStats
 	stopCleanup chan struct{}
@@ -26,6 +27,7 @@ type cacheEntry struct {
 	result      core.MCPCachedResult
 	lastAccess  time.Time
 	accessCount int64
+	element     *list.Element // position in accessOrder
 }
 
 // cacheStats tracks cache performance metrics.
@@ -45,7 +47,7 @@ func NewMemoryCache(config core.MCPCacheConfig) (*MemoryCache, error) {
 
 	cache := &MemoryCache{
 		data:        make(map[string]*cacheEntry),
-		accessOrder: make([]string, 0),
+		accessOrder: list.New(),
 		config:      config,
 		stats: cacheStats{
 			lastCleanup: time.Now(),
@@ -75,8 +77,7 @@ func (c *MemoryCache) Get(ctx context.Context, key core.MCPCacheKey) (*core.MCPC
 
 	// Check TTL expiration
 	if time.Since(entry.result.Timestamp) > entry.result.TTL {
-		delete(c.data, keyStr)
-		c.removeFromAccessOrder(keyStr)
+		c.removeEntry(keyStr, entry)
 		c.stats.misses++
 		return nil, nil // Expired
 	}
@@ -85,7 +86,7 @@ func (c *MemoryCache) Get(ctx context.Context, key core.MCPCacheKey) (*core.MCPC
 	entry.lastAccess = time.Now()
 	entry.accessCount++
 	entry.result.AccessCount = int(entry.accessCount)
-	c.updateAccessOrder(keyStr)
+	c.accessOrder.MoveToBack(entry.element)
 	c.stats.hits++
 
 	// Return a copy to prevent external modification
@@ -110,6 +111,16 @@ func (c *MemoryCache) Set(ctx context.Context, key core.MCPCacheKey, result core
 		Metadata:    make(map[string]interface{}),
 	}
 
+	// Overwriting an existing key only refreshes it
+	if entry, exists := c.data[keyStr]; exists {
+		entry.result = cachedResult
+		entry.lastAccess = time.Now()
+		entry.accessCount = 1
+		c.accessOrder.MoveToBack(entry.element)
+		c.updateSize(keyStr, entry)
+		return nil
+	}
+
 	// Check if we need to evict entries
 	if len(c.data) >= c.config.MaxKeys {
 		c.evictLRU()
@@ -121,9 +132,9 @@ func (c *MemoryCache) Set(ctx context.Context, key core.MCPCacheKey, result core
 		lastAccess:  time.Now(),
 		accessCount: 1,
 	}
+	entry.element = c.accessOrder.PushBack(keyStr)
 
 	c.data[keyStr] = entry
-	c.addToAccessOrder(keyStr)
 	c.updateSize(keyStr, entry)
 
 	return nil
@@ -135,9 +146,8 @@ func (c *MemoryCache) Delete(ctx context.Context, key core.MCPCacheKey) error {
 	defer c.mu.Unlock()
 
 	keyStr := c.keyToString(key)
-	if _, exists := c.data[keyStr]; exists {
-		delete(c.data, keyStr)
-		c.removeFromAccessOrder(keyStr)
+	if entry, exists := c.data[keyStr]; exists {
+		c.removeEntry(keyStr, entry)
 	}
 
 	return nil
@@ -149,7 +159,7 @@ func (c *MemoryCache) Clear(ctx context.Context) error {
 	defer c.mu.Unlock()
 
 	c.data = make(map[string]*cacheEntry)
-	c.accessOrder = make([]string, 0)
+	c.accessOrder.Init()
 	c.stats.totalSize = 0
 
 	return nil
@@ -218,38 +228,23 @@ func (c *MemoryCache) Close() error {
 // Helper methods
 
 func (c *MemoryCache) keyToString(key core.MCPCacheKey) string {
-	return fmt.Sprintf("%s:%s:%s", key.ServerName, key.ToolName, key.Hash)
-}
-
-func (c *MemoryCache) updateAccessOrder(keyStr string) {
-	// Remove from current position
-	c.removeFromAccessOrder(keyStr)
-	// Add to end (most recently used)
-	c.accessOrder = append(c.accessOrder, keyStr)
+	return key.ServerName + ":" + key.ToolName + ":" + key.Hash
 }
 
-func (c *MemoryCache) addToAccessOrder(keyStr string) {
-	c.accessOrder = append(c.accessOrder, keyStr)
-}
-
-func (c *MemoryCache) removeFromAccessOrder(keyStr string) {
-	for i, key := range c.accessOrder {
-		if key == keyStr {
-			c.accessOrder = append(c.accessOrder[:i], c.accessOrder[i+1:]...)
-			break
-		}
-	}
+func (c *MemoryCache) removeEntry(keyStr string, entry *cacheEntry) {
+	delete(c.data, keyStr)
+	c.accessOrder.Remove(entry.element)
 }
 
 func (c *MemoryCache) evictLRU() {
-	if len(c.accessOrder) == 0 {
+	front := c.accessOrder.Front()
+	if front == nil {
 		return
 	}
 
-	// Remove least recently used (first in order)
-	lruKey := c.accessOrder[0]
-	delete(c.data, lruKey)
-	c.accessOrder = c.accessOrder[1:]
+	// Remove least recently used (front of the list)
+	lruKey := front.Value.(string)
+	c.removeEntry(lruKey, c.data[lruKey])
 	c.stats.evictions++
 }
 
@@ -274,8 +269,7 @@ func (c *MemoryCache) cleanupExpired() {
 	}
 
 	for _, keyStr := range expiredKeys {
-		delete(c.data, keyStr)
-		c.removeFromAccessOrder(keyStr)
+		c.removeEntry(keyStr, c.data[keyStr])
 	}
 }
 
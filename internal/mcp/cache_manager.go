@@ -5,6 +5,7 @@ import (
 	"context"
 	"fmt"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/agenticgokit/agenticgokit/core"
@@ -12,6 +13,7 @@ import (
 
 // CacheManager implements MCPCacheManager and manages cache instances for MCP tools.
 type CacheManager struct {
+	mu       sync.RWMutex // guards caches and config; tools may execute concurrently
 	caches   map[string]core.MCPCache
 	config   core.MCPCacheConfig
 	executor MCPToolExecutor // Interface to execute tools without cache
@@ -43,12 +45,28 @@ func NewCacheManager(config core.MCPCacheConfig, executor MCPToolExecutor) (*Cac
 
 // GetCache returns a cache instance for a specific tool or server.
 func (cm *CacheManager) GetCache(toolName, serverName string) core.MCPCache {
-	if !cm.config.Enabled {
+	cacheKey := serverName + ":" + toolName
+
+	cm.mu.RLock()
+	enabled := cm.config.Enabled
+	cache, exists := cm.caches[cacheKey]
+	cm.mu.RUnlock()
+	if !enabled {
 		return &NoOpCache{} // Return no-op cache when disabled
 	}
+	if exists {
+		return cache
+	}
 
-	cacheKey := fmt.Sprintf("%s:%s", serverName, toolName)
+	cm.mu.Lock()
+	defer cm.mu.Unlock()
 
+	// Configure may have disabled caching while we waited for the lock
+	if !cm.config.Enabled {
+		return &NoOpCache{}
+	}
+
+	// Another caller may have created it while we waited for the lock
 	if cache, exists := cm.caches[cacheKey]; exists {
 		return cache
 	}
@@ -66,14 +84,19 @@ func (cm *CacheManager) GetCache(toolName, serverName string) core.MCPCache {
 
 // ExecuteWithCache executes a tool with caching support.
 func (cm *CacheManager) ExecuteWithCache(ctx context.Context, execution core.MCPToolExecution) (core.MCPToolResult, error) {
-	if !cm.config.Enabled {
+	config := cm.currentConfig()
+	if !config.Enabled {
 		return cm.executor.ExecuteTool(ctx, execution.ToolName, execution.Arguments)
 	}
 
 	// Convert arguments to string map for cache key
 	args := make(map[string]string)
 	for k, v := range execution.Arguments {
-		args[k] = fmt.Sprintf("%v", v)
+		if str, ok := v.(string); ok {
+			args[k] = str // same as %v for strings, without going through fmt
+		} else {
+			args[k] = fmt.Sprintf("%v", v)
+		}
 	}
 
 	// Generate cache key
@@ -102,7 +125,7 @@ func (cm *CacheManager) ExecuteWithCache(ctx context.Context, execution core.MCP
 
 	// Cache the result if successful
 	if result.Success {
-		ttl := cm.getTTLForTool(execution.ToolName)
+		ttl := getTTLForTool(config, execution.ToolName)
 
 		// Add execution time to the first content item's metadata
 		if len(result.Content) > 0 {
@@ -125,6 +148,9 @@ func (cm *CacheManager) ExecuteWithCache(ctx context.Context, execution core.MCP
 
 // InvalidateByPattern invalidates cache entries matching a pattern.
 func (cm *CacheManager) InvalidateByPattern(ctx context.Context, pattern string) error {
+	cm.mu.RLock()
+	defer cm.mu.RUnlock()
+
 	if !cm.config.Enabled {
 		return nil
 	}
@@ -147,6 +173,9 @@ func (cm *CacheManager) InvalidateByPattern(ctx context.Context, pattern string)
 
 // GetGlobalStats returns aggregated cache statistics.
 func (cm *CacheManager) GetGlobalStats(ctx context.Context) (core.MCPCacheStats, error) {
+	cm.mu.RLock()
+	defer cm.mu.RUnlock()
+
 	if !cm.config.Enabled {
 		return core.MCPCacheStats{}, nil
 	}
@@ -184,6 +213,9 @@ func (cm *CacheManager) GetGlobalStats(ctx context.Context) (core.MCPCacheStats,
 
 // Configure updates cache configuration.
 func (cm *CacheManager) Configure(config core.MCPCacheConfig) error {
+	cm.mu.Lock()
+	defer cm.mu.Unlock()
+
 	cm.config = config
 
 	// If caching is disabled, clear all caches
@@ -197,16 +229,26 @@ func (cm *CacheManager) Configure(config core.MCPCacheConfig) error {
 	return nil
 }
 
+// currentConfig returns a snapshot of the configuration taken under the lock.
+func (cm *CacheManager) currentConfig() core.MCPCacheConfig {
+	cm.mu.RLock()
+	defer cm.mu.RUnlock()
+	return cm.config
+}
+
 // getTTLForTool returns the TTL for a specific tool.
-func (cm *CacheManager) getTTLForTool(toolName string) time.Duration {
-	if ttl, exists := cm.config.ToolTTLs[toolName]; exists {
+func getTTLForTool(config core.MCPCacheConfig, toolName string) time.Duration {
+	if ttl, exists := config.ToolTTLs[toolName]; exists {
 		return ttl
 	}
-	return cm.config.DefaultTTL
+	return config.DefaultTTL
 }
 
 // Close closes all cache instances and releases resources.
 func (cm *CacheManager) Close() error {
+	cm.mu.Lock()
+	defer cm.mu.Unlock()
+
 	for _, cache := range cm.caches {
 		cache.Close()
 	}
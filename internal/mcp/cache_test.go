@@ -0,0 +1,121 @@
+package mcp
+
+import (
+	"context"
+	"fmt"
+	"sync"
+	"testing"
+	"time"
+
+	"github.com/agenticgokit/agenticgokit/core"
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func newTestMemoryCache(t *testing.T, maxKeys int) *MemoryCache {
+	t.Helper()
+
+	config := core.DefaultMCPCacheConfig()
+	config.MaxKeys = maxKeys
+	cache, err := NewMemoryCache(config)
+	require.NoError(t, err)
+	t.Cleanup(func() { cache.Close() })
+	return cache
+}
+
+func testCacheKey(name string) core.MCPCacheKey {
+	return core.MCPCacheKey{ServerName: "server", ToolName: name, Hash: "h"}
+}
+
+func TestMemoryCache_EvictsLeastRecentlyUsed(t *testing.T) {
+	ctx := context.Background()
+	cache := newTestMemoryCache(t, 2)
+
+	require.NoError(t, cache.Set(ctx, testCacheKey("a"), core.MCPToolResult{ToolName: "a"}, time.Minute))
+	require.NoError(t, cache.Set(ctx, testCacheKey("b"), core.MCPToolResult{ToolName: "b"}, time.Minute))
+
+	// Touch "a" so that "b" becomes the least recently used entry
+	result, err := cache.Get(ctx, testCacheKey("a"))
+	require.NoError(t, err)
+	require.NotNil(t, result)
+
+	require.NoError(t, cache.Set(ctx, testCacheKey("c"), core.MCPToolResult{ToolName: "c"}, time.Minute))
+
+	exists, _ := cache.Exists(ctx, testCacheKey("b"))
+	assert.False(t, exists, "least recently used entry should be evicted")
+	exists, _ = cache.Exists(ctx, testCacheKey("a"))
+	assert.True(t, exists)
+	exists, _ = cache.Exists(ctx, testCacheKey("c"))
+	assert.True(t, exists)
+
+	stats, err := cache.Stats(ctx)
+	require.NoError(t, err)
+	assert.Equal(t, 2, stats.TotalKeys)
+	assert.Equal(t, int64(1), stats.EvictionCount)
+}
+
+func TestMemoryCache_OverwriteDoesNotEvict(t *testing.T) {
+	ctx := context.Background()
+	cache := newTestMemoryCache(t, 2)
+
+	require.NoError(t, cache.Set(ctx, testCacheKey("a"), core.MCPToolResult{ToolName: "a"}, time.Minute))
+	require.NoError(t, cache.Set(ctx, testCacheKey("b"), core.MCPToolResult{ToolName: "b"}, time.Minute))
+	require.NoError(t, cache.Set(ctx, testCacheKey("a"), core.MCPToolResult{ToolName: "a2"}, time.Minute))
+
+	result, err := cache.Get(ctx, testCacheKey("a"))
+	require.NoError(t, err)
+	require.NotNil(t, result)
+	assert.Equal(t, "a2", result.Result.ToolName)
+
+	exists, _ := cache.Exists(ctx, testCacheKey("b"))
+	assert.True(t, exists, "overwriting a key must not evict other entries")
+
+	require.NoError(t, cache.Delete(ctx, testCacheKey("a")))
+	require.NoError(t, cache.Set(ctx, testCacheKey("c"), core.MCPToolResult{ToolName: "c"}, time.Minute))
+
+	stats, err := cache.Stats(ctx)
+	require.NoError(t, err)
+	assert.Equal(t, 2, stats.TotalKeys)
+	assert.Equal(t, int64(0), stats.EvictionCount)
+}
+
+type echoExecutor struct{}
+
+func (echoExecutor) ExecuteTool(ctx context.Context, toolName string, args map[string]interface{}) (core.MCPToolResult, error) {
+	return core.MCPToolResult{ToolName: toolName, Success: true}, nil
+}
+
+// Run with -race: Configure must not race with tools executing through the cache.
+func TestCacheManager_ConfigureDuringExecution(t *testing.T) {
+	ctx := context.Background()
+	config := core.DefaultMCPCacheConfig()
+	config.Enabled = true
+	manager, err := NewCacheManager(config, echoExecutor{})
+	require.NoError(t, err)
+	t.Cleanup(func() { manager.Close() })
+
+	var wg sync.WaitGroup
+	for i := 0; i < 8; i++ {
+		wg.Add(1)
+		go func(i int) {
+			defer wg.Done()
+			for j := 0; j < 50; j++ {
+				result, err := manager.ExecuteWithCache(ctx, core.MCPToolExecution{
+					ToolName:   fmt.Sprintf("tool-%d", j%4),
+					ServerName: "server",
+					Arguments:  map[string]interface{}{"n": i},
+				})
+				assert.NoError(t, err)
+				assert.True(t, result.Success)
+			}
+		}(i)
+	}
+
+	for j := 0; j < 20; j++ {
+		next := config
+		next.Enabled = j%2 == 0
+		next.ToolTTLs = map[string]time.Duration{"tool-0": time.Duration(j+1) * time.Second}
+		require.NoError(t, manager.Configure(next))
+	}
+	wg.Wait()
+}
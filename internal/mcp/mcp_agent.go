@@ -6,6 +6,7 @@ import (
 	"encoding/json"
 	"fmt"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/agenticgokit/agenticgokit/core"
@@ -29,10 +30,11 @@ type MCPAgentConfig struct {
 	ToolSelectionTimeout time.Duration `toml:"tool_selection_timeout"`
 
 	// Execution settings
-	ParallelExecution bool          `toml:"parallel_execution"`
-	ExecutionTimeout  time.Duration `toml:"execution_timeout"`
-	RetryFailedTools  bool          `toml:"retry_failed_tools"`
-	MaxRetries        int           `toml:"max_retries"`
+	ParallelExecution  bool          `toml:"parallel_execution"`
+	MaxConcurrentTools int           `toml:"max_concurrent_tools"` // Upper bound on in-flight tools when ParallelExecution is set
+	ExecutionTimeout   time.Duration `toml:"execution_timeout"`
+	RetryFailedTools   bool          `toml:"retry_failed_tools"`
+	MaxRetries         int           `toml:"max_retries"`
 
 	// LLM integration settings
 	UseToolDescriptions  bool   `toml:"use_tool_descriptions"`
@@ -50,6 +52,7 @@ func DefaultMCPAgentConfig() MCPAgentConfig {
 		MaxToolsPerExecution: 5,
 		ToolSelectionTimeout: 30 * time.Second,
 		ParallelExecution:    false,
+		MaxConcurrentTools:   4,
 		ExecutionTimeout:     2 * time.Minute,
 		RetryFailedTools:     true,
 		MaxRetries:           3,
@@ -237,33 +240,81 @@ func (a *MCPAwareAgent) executeToolsSequential(ctx context.Context, tools []core
 			Int("total", len(tools)).
 			Msg("Executing tool")
 
-		result, err := a.executeSingleTool(ctx, tool)
-		if err != nil {
-			if a.config.RetryFailedTools {
-				result, err = a.retryToolExecution(ctx, tool, err)
+		results = append(results, a.executeToolWithRetry(ctx, tool))
+	}
+
+	return results, nil
+}
+
+// executeToolsParallel executes tools concurrently, keeping at most
+// MaxConcurrentTools in flight. Results are returned in input order.
+func (a *MCPAwareAgent) executeToolsParallel(ctx context.Context, tools []core.MCPToolExecution) ([]core.MCPToolResult, error) {
+	limit := a.config.MaxConcurrentTools
+	if limit <= 0 || limit > len(tools) {
+		limit = len(tools)
+	}
+
+	a.logger.Debug().
+		Int("total", len(tools)).
+		Int("max_concurrent", limit).
+		Msg("Executing tools in parallel")
+
+	results := make([]core.MCPToolResult, len(tools))
+	sem := make(chan struct{}, limit)
+	var wg sync.WaitGroup
+
+	for i, tool := range tools {
+		wg.Add(1)
+		go func(i int, tool core.MCPToolExecution) {
+			defer wg.Done()
+
+			select {
+			case sem <- struct{}{}:
+				defer func() { <-sem }()
+			case <-ctx.Done():
 			}
-			if err != nil {
-				// Return partial results with error
-				result = core.MCPToolResult{
+
+			// select picks at random when both cases are ready, so a slot can
+			// still be taken after cancellation; check again before running.
+			if err := ctx.Err(); err != nil {
+				results[i] = core.MCPToolResult{
 					ToolName: tool.ToolName,
 					Success:  false,
 					Error:    err.Error(),
 				}
+				return
 			}
-		}
 
-		results = append(results, result)
+			results[i] = a.executeToolWithRetry(ctx, tool)
+		}(i, tool)
 	}
 
+	wg.Wait()
+
+	if err := ctx.Err(); err != nil {
+		return results, err
+	}
 	return results, nil
 }
 
-// executeToolsParallel executes tools in parallel (future enhancement).
-func (a *MCPAwareAgent) executeToolsParallel(ctx context.Context, tools []core.MCPToolExecution) ([]core.MCPToolResult, error) {
-	// For now, fall back to sequential execution
-	// This can be enhanced with goroutines and proper synchronization
-	a.logger.Debug().Msg("Parallel execution not fully implemented, falling back to sequential")
-	return a.executeToolsSequential(ctx, tools)
+// executeToolWithRetry executes a single tool, retrying on failure if configured.
+// Failures are reported in the returned result rather than as an error.
+func (a *MCPAwareAgent) executeToolWithRetry(ctx context.Context, tool core.MCPToolExecution) core.MCPToolResult {
+	result, err := a.executeSingleTool(ctx, tool)
+	if err != nil {
+		if a.config.RetryFailedTools {
+			result, err = a.retryToolExecution(ctx, tool, err)
+		}
+		if err != nil {
+			// Return partial results with error
+			result = core.MCPToolResult{
+				ToolName: tool.ToolName,
+				Success:  false,
+				Error:    err.Error(),
+			}
+		}
+	}
+	return result
 }
 
 // executeSingleTool executes a single MCP tool with caching support.
@@ -489,10 +540,11 @@ func (a *MCPAwareAgent) validateSelectedTools(selected []string, available []cor
 // prepareToolExecutions prepares tool execution requests from tool names and state.
 func (a *MCPAwareAgent) prepareToolExecutions(ctx context.Context, toolNames []string, state core.State) ([]core.MCPToolExecution, error) {
 	executions := make([]core.MCPToolExecution, 0, len(toolNames))
+	toolIndex := a.indexToolInfo()
 
 	for _, toolName := range toolNames {
 		// Get tool info to understand its schema
-		toolInfo := a.findToolInfo(toolName)
+		toolInfo := toolIndex[toolName]
 		if toolInfo == nil {
 			a.logger.Warn().
 				Str("tool", toolName).
@@ -513,50 +565,43 @@ func (a *MCPAwareAgent) prepareToolExecutions(ctx context.Context, toolNames []s
 	return executions, nil
 }
 
-// findToolInfo finds information about a specific tool.
-func (a *MCPAwareAgent) findToolInfo(toolName string) *core.MCPToolInfo {
+// indexToolInfo builds a name lookup table over the currently available tools
+// so that resolving several tools costs a single GetAvailableTools call.
+func (a *MCPAwareAgent) indexToolInfo() map[string]*core.MCPToolInfo {
 	tools := a.mcpManager.GetAvailableTools()
-	for _, tool := range tools {
-		if tool.Name == toolName {
-			return &tool
+	index := make(map[string]*core.MCPToolInfo, len(tools))
+	for i := range tools {
+		if _, exists := index[tools[i].Name]; !exists {
+			index[tools[i].Name] = &tools[i]
 		}
 	}
-	return nil
+	return index
 }
 
 // prepareToolArguments prepares arguments for a tool based on state and schema.
 func (a *MCPAwareAgent) prepareToolArguments(toolName string, toolInfo *core.MCPToolInfo, state core.State) map[string]interface{} {
 	args := make(map[string]interface{})
 
-	// Basic argument mapping based on common patterns
-	keys := state.Keys()
-	stateMap := make(map[string]interface{})
-	for _, key := range keys {
-		if value, exists := state.Get(key); exists {
-			stateMap[key] = value
-		}
-	}
+	// Look up only the keys we map instead of copying the whole state per tool
+	query, hasQuery := state.Get("query")
+	url, hasURL := state.Get("url")
 
 	// Common argument mappings
-	if query, exists := stateMap["query"]; exists {
+	if hasQuery {
 		args["query"] = query
 	}
-	if text, exists := stateMap["text"]; exists {
+	if text, exists := state.Get("text"); exists {
 		args["text"] = text
 	}
-	if url, exists := stateMap["url"]; exists {
+	if hasURL {
 		args["url"] = url
 	}
 
 	// Tool-specific argument mapping
 	switch toolName {
 	case "search":
-		if q, exists := stateMap["query"]; exists {
-			args["q"] = q
-		}
-	case "fetch_content":
-		if url, exists := stateMap["url"]; exists {
-			args["url"] = url
+		if hasQuery {
+			args["q"] = query
 		}
 	}
 
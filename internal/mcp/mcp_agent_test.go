@@ -0,0 +1,224 @@
+package mcp
+
+import (
+	"context"
+	"sync/atomic"
+	"testing"
+	"time"
+
+	"github.com/agenticgokit/agenticgokit/core"
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func TestExecuteToolsParallel_PreservesOrder(t *testing.T) {
+	config := DefaultMCPAgentConfig()
+	config.EnableCaching = false
+	config.ParallelExecution = true
+	config.MaxConcurrentTools = 2
+
+	agent := NewMCPAwareAgent("parallel", nil, nil, config)
+
+	tools := []core.MCPToolExecution{
+		{ToolName: "first"},
+		{ToolName: "second"},
+		{ToolName: "third"},
+		{ToolName: "fourth"},
+		{ToolName: "fifth"},
+	}
+
+	results, err := agent.ExecuteTools(context.Background(), tools)
+	require.NoError(t, err)
+	require.Len(t, results, len(tools))
+
+	for i, tool := range tools {
+		assert.Equal(t, tool.ToolName, results[i].ToolName)
+		assert.True(t, results[i].Success)
+	}
+}
+
+func TestExecuteToolsParallel_CanceledContext(t *testing.T) {
+	config := DefaultMCPAgentConfig()
+	config.EnableCaching = false
+	config.ParallelExecution = true
+
+	agent := NewMCPAwareAgent("parallel", nil, nil, config)
+
+	ctx, cancel := context.WithCancel(context.Background())
+	cancel()
+
+	_, err := agent.ExecuteTools(ctx, []core.MCPToolExecution{{ToolName: "tool"}})
+	assert.ErrorIs(t, err, context.Canceled)
+}
+
+// blockingCacheManager is a core.MCPCacheManager whose executions block until
+// release is closed, recording how many run at the same time.
+type blockingCacheManager struct {
+	started  chan string
+	release  chan struct{}
+	inFlight int32
+	maxSeen  int32
+}
+
+func newBlockingCacheManager(n int) *blockingCacheManager {
+	return &blockingCacheManager{
+		started: make(chan string, n),
+		release: make(chan struct{}),
+	}
+}
+
+func (m *blockingCacheManager) GetCache(toolName, serverName string) core.MCPCache { return nil }
+
+func (m *blockingCacheManager) ExecuteWithCache(ctx context.Context, execution core.MCPToolExecution) (core.MCPToolResult, error) {
+	n := atomic.AddInt32(&m.inFlight, 1)
+	for {
+		seen := atomic.LoadInt32(&m.maxSeen)
+		if n <= seen || atomic.CompareAndSwapInt32(&m.maxSeen, seen, n) {
+			break
+		}
+	}
+	m.started <- execution.ToolName
+	<-m.release
+	atomic.AddInt32(&m.inFlight, -1)
+
+	return core.MCPToolResult{ToolName: execution.ToolName, Success: true}, nil
+}
+
+func (m *blockingCacheManager) InvalidateByPattern(ctx context.Context, pattern string) error {
+	return nil
+}
+
+func (m *blockingCacheManager) GetGlobalStats(ctx context.Context) (core.MCPCacheStats, error) {
+	return core.MCPCacheStats{}, nil
+}
+
+func (m *blockingCacheManager) Shutdown() error { return nil }
+
+func (m *blockingCacheManager) Configure(config core.MCPCacheConfig) error { return nil }
+
+func newBlockingAgent(t *testing.T, maxConcurrent, tools int) (*MCPAwareAgent, *blockingCacheManager) {
+	t.Helper()
+
+	config := DefaultMCPAgentConfig()
+	config.EnableCaching = true
+	config.ParallelExecution = true
+	config.RetryFailedTools = false
+	config.MaxConcurrentTools = maxConcurrent
+
+	agent := NewMCPAwareAgent("parallel", nil, nil, config)
+	manager := newBlockingCacheManager(tools)
+	agent.cacheManager = manager
+	return agent, manager
+}
+
+func waitForStarts(t *testing.T, started <-chan string, n int) {
+	t.Helper()
+	for i := 0; i < n; i++ {
+		select {
+		case <-started:
+		case <-time.After(2 * time.Second):
+			t.Fatalf("only %d of %d tools started", i, n)
+		}
+	}
+}
+
+func TestExecuteToolsParallel_OverlapsUpToLimit(t *testing.T) {
+	tools := []core.MCPToolExecution{
+		{ToolName: "first"},
+		{ToolName: "second"},
+		{ToolName: "third"},
+		{ToolName: "fourth"},
+		{ToolName: "fifth"},
+		{ToolName: "sixth"},
+	}
+	const limit = 3
+	agent, manager := newBlockingAgent(t, limit, len(tools))
+
+	type outcome struct {
+		results []core.MCPToolResult
+		err     error
+	}
+	done := make(chan outcome, 1)
+	go func() {
+		results, err := agent.ExecuteTools(context.Background(), tools)
+		done <- outcome{results, err}
+	}()
+
+	// All slots fill while every tool is still blocked, so the tools overlap
+	waitForStarts(t, manager.started, limit)
+	select {
+	case name := <-manager.started:
+		t.Fatalf("tool %q started while %d tools were already in flight", name, limit)
+	case <-time.After(50 * time.Millisecond):
+	}
+	assert.Equal(t, int32(limit), atomic.LoadInt32(&manager.inFlight))
+
+	close(manager.release)
+
+	var out outcome
+	select {
+	case out = <-done:
+	case <-time.After(2 * time.Second):
+		t.Fatal("ExecuteTools did not return after tools were released")
+	}
+	require.NoError(t, out.err)
+	require.Len(t, out.results, len(tools))
+	for i, tool := range tools {
+		assert.Equal(t, tool.ToolName, out.results[i].ToolName)
+		assert.True(t, out.results[i].Success)
+	}
+	assert.Equal(t, int32(limit), atomic.LoadInt32(&manager.maxSeen))
+}
+
+func TestExecuteToolsParallel_CancelFailsQueuedTools(t *testing.T) {
+	tools := []core.MCPToolExecution{
+		{ToolName: "running"},
+		{ToolName: "queued-1"},
+		{ToolName: "queued-2"},
+	}
+	agent, manager := newBlockingAgent(t, 1, len(tools))
+
+	ctx, cancel := context.WithCancel(context.Background())
+	defer cancel()
+
+	type outcome struct {
+		results []core.MCPToolResult
+		err     error
+	}
+	done := make(chan outcome, 1)
+	go func() {
+		results, err := agent.ExecuteTools(ctx, tools)
+		done <- outcome{results, err}
+	}()
+
+	var running string
+	select {
+	case running = <-manager.started:
+	case <-time.After(2 * time.Second):
+		t.Fatal("no tool started")
+	}
+
+	// Freeing the slot after cancellation must not let a queued tool run
+	cancel()
+	close(manager.release)
+
+	var out outcome
+	select {
+	case out = <-done:
+	case <-time.After(2 * time.Second):
+		t.Fatal("ExecuteTools did not return after cancellation")
+	}
+	assert.ErrorIs(t, out.err, context.Canceled)
+	require.Len(t, out.results, len(tools))
+	assert.Empty(t, manager.started, "no tool should start after cancellation")
+
+	for i, tool := range tools {
+		assert.Equal(t, tool.ToolName, out.results[i].ToolName)
+		if tool.ToolName == running {
+			assert.True(t, out.results[i].Success)
+			continue
+		}
+		assert.False(t, out.results[i].Success)
+		assert.Equal(t, context.Canceled.Error(), out.results[i].Error)
+	}
+}
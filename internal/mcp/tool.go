@@ -9,6 +9,7 @@ import (
 	"encoding/json"
 	"fmt"
 	"time"
+	"unicode/utf8"
 
 	"github.com/agenticgokit/agenticgokit/core"
 	"github.com/kunalkushwaha/mcp-navigator-go/pkg/client"
@@ -19,8 +20,10 @@ import (
 // It manages the connection to an MCP server and translates calls between AgentFlow and MCP protocols.
 type MCPTool struct {
 	name        string
+	qualified   string // "mcp_<server>_<tool>", computed once in NewMCPTool
 	description string
 	schema      map[string]interface{}
+	validator   *argumentValidator // compiled from schema once in NewMCPTool
 	serverName  string
 	client      *client.Client
 	manager     *MCPManagerImpl
@@ -31,8 +34,10 @@ type MCPTool struct {
 func NewMCPTool(toolInfo mcp.Tool, serverName string, mcpClient *client.Client, manager *MCPManagerImpl) *MCPTool {
 	return &MCPTool{
 		name:        toolInfo.Name,
+		qualified:   qualifiedToolName(serverName, toolInfo.Name),
 		description: toolInfo.Description,
 		schema:      toolInfo.InputSchema,
+		validator:   compileArgumentValidator(toolInfo.InputSchema),
 		serverName:  serverName,
 		client:      mcpClient,
 		manager:     manager,
@@ -43,7 +48,15 @@ func NewMCPTool(toolInfo mcp.Tool, serverName string, mcpClient *client.Client,
 // Name returns the unique identifier for the tool.
 // This implements the FunctionTool interface.
 func (t *MCPTool) Name() string {
-	return fmt.Sprintf("mcp_%s_%s", t.serverName, t.name)
+	if t.qualified != "" {
+		return t.qualified
+	}
+	return qualifiedToolName(t.serverName, t.name)
+}
+
+// qualifiedToolName builds the registry name for a tool on a given server.
+func qualifiedToolName(serverName, toolName string) string {
+	return "mcp_" + serverName + "_" + toolName
 }
 
 // Call executes the MCP tool with the given arguments.
@@ -142,51 +155,85 @@ func (t *MCPTool) convertArgumentsToMCP(args map[string]any) (map[string]interfa
 	return mcpArgs, nil
 }
 
-// validateArguments validates the arguments against the tool's schema.
-func (t *MCPTool) validateArguments(args map[string]interface{}) error {
-	// Basic validation - check required fields if schema defines them
-	if t.schema == nil {
-		return nil // No schema to validate against
-	}
-
-	// Check if schema defines required properties
-	if properties, ok := t.schema["properties"].(map[string]interface{}); ok {
-		if required, ok := t.schema["required"].([]interface{}); ok {
-			for _, reqField := range required {
-				if fieldName, ok := reqField.(string); ok {
-					if _, exists := args[fieldName]; !exists {
-						return fmt.Errorf("required argument '%s' is missing", fieldName)
-					}
-				}
+// argumentValidator holds the parts of a tool's input schema that are checked
+// on every call, extracted once so Call does not re-walk the schema maps.
+type argumentValidator struct {
+	required []string          // required argument names, in schema order
+	types    map[string]string // argument name -> JSON schema type
+}
+
+// compileArgumentValidator extracts the required fields and declared property
+// types from a tool's input schema. Validation only applies when the schema
+// declares properties; otherwise the returned validator accepts anything.
+func compileArgumentValidator(schema map[string]interface{}) *argumentValidator {
+	v := &argumentValidator{}
+	if schema == nil {
+		return v // No schema to validate against
+	}
+
+	properties, ok := schema["properties"].(map[string]interface{})
+	if !ok {
+		return v
+	}
+
+	if required, ok := schema["required"].([]interface{}); ok {
+		for _, reqField := range required {
+			if fieldName, ok := reqField.(string); ok {
+				v.required = append(v.required, fieldName)
 			}
 		}
+	}
 
-		// Basic type checking for provided arguments
-		for argName, argValue := range args {
-			if propSchema, exists := properties[argName]; exists {
-				if err := t.validateArgumentType(argName, argValue, propSchema); err != nil {
-					return err
-				}
-			}
+	v.types = make(map[string]string, len(properties))
+	for propName, propSchema := range properties {
+		schemaMap, ok := propSchema.(map[string]interface{})
+		if !ok {
+			continue // Can't validate if schema is not a map
+		}
+		if expectedType, ok := schemaMap["type"].(string); ok {
+			v.types[propName] = expectedType
 		}
 	}
 
-	return nil
+	return v
 }
 
-// validateArgumentType performs basic type validation for an argument.
-func (t *MCPTool) validateArgumentType(name string, value interface{}, schema interface{}) error {
-	schemaMap, ok := schema.(map[string]interface{})
-	if !ok {
-		return nil // Can't validate if schema is not a map
+// validate checks required fields and the types of the provided arguments.
+func (v *argumentValidator) validate(args map[string]interface{}) error {
+	for _, fieldName := range v.required {
+		if _, exists := args[fieldName]; !exists {
+			return fmt.Errorf("required argument '%s' is missing", fieldName)
+		}
 	}
 
-	expectedType, ok := schemaMap["type"].(string)
-	if !ok {
-		return nil // No type specified in schema
+	if len(v.types) == 0 {
+		return nil
+	}
+
+	// Basic type checking for provided arguments
+	for argName, argValue := range args {
+		if expectedType, exists := v.types[argName]; exists {
+			if err := validateArgumentType(argName, argValue, expectedType); err != nil {
+				return err
+			}
+		}
+	}
+
+	return nil
+}
+
+// validateArguments validates the arguments against the tool's schema.
+func (t *MCPTool) validateArguments(args map[string]interface{}) error {
+	validator := t.validator
+	if validator == nil {
+		// Tools not built through NewMCPTool compile their schema on demand
+		validator = compileArgumentValidator(t.schema)
 	}
+	return validator.validate(args)
+}
 
-	// Basic type checking
+// validateArgumentType performs basic type validation for an argument.
+func validateArgumentType(name string, value interface{}, expectedType string) error {
 	switch expectedType {
 	case "string":
 		if _, ok := value.(string); !ok {
@@ -332,11 +379,30 @@ func (t *MCPTool) formatMCPContent(contents []mcp.Content) string {
 		return fmt.Sprintf("content with %d items", len(contents))
 	}
 
+	first := truncateContent(parts[0], maxErrorContentLength)
 	if len(parts) == 1 {
-		return parts[0]
+		return first
 	}
 
-	return fmt.Sprintf("%s (and %d more)", parts[0], len(parts)-1)
+	return fmt.Sprintf("%s (and %d more)", first, len(parts)-1)
+}
+
+// maxErrorContentLength bounds how much of a tool's error content is copied
+// into the returned error, so a large error payload does not end up in logs
+// and prompts in full.
+const maxErrorContentLength = 1024
+
+// truncateContent shortens text to at most limit bytes without splitting a
+// UTF-8 sequence, marking the cut with "... (truncated)".
+func truncateContent(text string, limit int) string {
+	if len(text) <= limit {
+		return text
+	}
+	cut := limit
+	for cut > 0 && !utf8.RuneStart(text[cut]) {
+		cut--
+	}
+	return text[:cut] + "... (truncated)"
 }
 
 // buildImageData creates an image data map from MCP content.
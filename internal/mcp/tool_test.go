@@ -0,0 +1,51 @@
+package mcp
+
+import (
+	"strings"
+	"testing"
+	"unicode/utf8"
+
+	"github.com/kunalkushwaha/mcp-navigator-go/pkg/mcp"
+	"github.com/stretchr/testify/assert"
+)
+
+func TestFormatMCPContent_TruncatesLargeContent(t *testing.T) {
+	tool := &MCPTool{name: "test"}
+
+	short := tool.formatMCPContent([]mcp.Content{{Type: "text", Text: "boom"}})
+	assert.Equal(t, "boom", short)
+
+	large := strings.Repeat("é", maxErrorContentLength)
+	result := tool.formatMCPContent([]mcp.Content{
+		{Type: "text", Text: large},
+		{Type: "text", Text: "second"},
+	})
+
+	assert.True(t, strings.HasSuffix(result, "... (truncated) (and 1 more)"))
+	assert.LessOrEqual(t, len(result), maxErrorContentLength+len("... (truncated) (and 1 more)"))
+	assert.True(t, utf8.ValidString(result))
+}
+
+func TestValidateArguments_CompiledSchema(t *testing.T) {
+	schema := map[string]interface{}{
+		"type": "object",
+		"properties": map[string]interface{}{
+			"path":  map[string]interface{}{"type": "string"},
+			"limit": map[string]interface{}{"type": "integer"},
+			"extra": "not-a-schema-map",
+		},
+		"required": []interface{}{"path"},
+	}
+	tool := NewMCPTool(mcp.Tool{Name: "read_file", InputSchema: schema}, "fs", nil, nil)
+
+	assert.NoError(t, tool.validateArguments(map[string]interface{}{"path": "/tmp", "limit": 10, "extra": 1}))
+	assert.EqualError(t, tool.validateArguments(map[string]interface{}{"limit": 10}),
+		"required argument 'path' is missing")
+	assert.EqualError(t, tool.validateArguments(map[string]interface{}{"path": 42}),
+		"argument 'path' must be a string, got int")
+
+	// Tools built without NewMCPTool still validate against their schema
+	literal := &MCPTool{name: "read_file", schema: schema}
+	assert.Error(t, literal.validateArguments(map[string]interface{}{}))
+	assert.NoError(t, (&MCPTool{name: "no_schema"}).validateArguments(map[string]interface{}{"any": 1}))
+}